@@ -2,40 +2,646 @@
 """
 OneTab Manager - A tool to search, filter, and batch delete OneTab saved tabs
 """
-from urllib.parse import urlparse, urlunparse
-import tkinter as tk
+import time
+
+# Taken before the remaining imports so --startup-bench covers them too.
+_STARTUP_T0 = time.perf_counter()
+
+import os
+import queue
 import re
-import tkinter.font as tkfont
-import requests
-import xml.etree.ElementTree as ET
+import sys
+import threading
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import re
-from urllib.parse import unquote, urlparse, parse_qs
-import json
-import os
+import tkinter.font as tkfont
 from collections import Counter
-from urllib.parse import quote
-from tkinter import filedialog
-import subprocess
+from tkinter import ttk, filedialog, messagebox
+from urllib.parse import quote, unquote, urlparse, urlunparse, parse_qs
+
+# requests, xml.etree, json and subprocess are only needed for arXiv lookups,
+# exports and opening a browser, so they are imported where they are used.
+# --startup-bench fails if any of these end up loaded before first paint.
+_DEFERRED_MODULES = ("requests", "xml.etree.ElementTree", "json", "subprocess")
 
 ONE_TAB_PREFIX = "chrome-extension://lnepcdnpflggegdhpnnffojfdpfoambo" "/suspended.html"
 
+# Exporters are generators that write one tab at a time to an open text file
+# and yield after each, so the caller can report progress or stop early.
+
+# read once here on the main thread: os.umask can only be queried by
+# setting it, which would race with exports running on worker threads
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# the fields of a tab that get exported; the rest (e.g. "id") are internal
+EXPORT_FIELDS = ("title", "url", "domain")
+
+
+def write_jsonl(f, tabs):
+    """One JSON object per line."""
+    import json
+
+    for tab in tabs:
+        row = {k: tab.get(k) for k in EXPORT_FIELDS}
+        f.write(json.dumps(row, ensure_ascii=False))
+        f.write("\n")
+        yield
+
+
+def write_json(f, tabs):
+    """A single compact JSON array, streamed element by element."""
+    import json
+
+    f.write("[")
+    for i, tab in enumerate(tabs):
+        if i:
+            f.write(",")
+        row = {k: tab.get(k) for k in EXPORT_FIELDS}
+        f.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+        yield
+    f.write("]\n")
+
+
+def write_csv(f, tabs):
+    """title,url,domain rows with a header."""
+    import csv
+
+    writer = csv.writer(f)
+    writer.writerow(EXPORT_FIELDS)
+    for tab in tabs:
+        writer.writerow([tab.get(k) for k in EXPORT_FIELDS])
+        yield
+
+
+def write_onetab(f, tabs):
+    """Native OneTab lines; entries without a URL are written as labels."""
+    for tab in tabs:
+        url = tab.get("url")
+        title = tab.get("title") or ""
+        if url:
+            frag = f"ttl={quote(title, safe='')}&uri={quote(url, safe='')}"
+            f.write(f"{ONE_TAB_PREFIX}#{frag}\n")
+        else:
+            f.write(f"{title}\n")
+        yield
+
+
+def write_pipe(f, tabs):
+    """The plain "URL | Title" lines this tool has always saved."""
+    for tab in tabs:
+        f.write(f"{tab.get('url')} | {tab.get('title')}\n")
+        yield
+
+
+# file extension -> (label, writer)
+EXPORT_FORMATS = {
+    ".jsonl": ("JSON Lines", write_jsonl),
+    ".json": ("JSON", write_json),
+    ".csv": ("CSV", write_csv),
+    ".txt": ("OneTab", write_onetab),
+}
+
+
+def export_tabs(tabs, path, writer, progress=None, cancel=None, every=10000):
+    """
+    Stream `tabs` to `path` with `writer`. The data goes to a temp file in
+    the same directory which is renamed over `path` only once complete, so
+    a failed or cancelled export never leaves a half-written file behind.
+
+    `progress(done, total)` is called every `every` tabs and at the end.
+    If the `cancel` event gets set, stops and returns False.
+    """
+    import tempfile
+
+    total = len(tabs)
+    # unique per export, so two exports to the same path can't collide
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with open(fd, "w", encoding="utf-8", newline="", buffering=1 << 20) as f:
+            for done, _ in enumerate(writer(f, tabs), start=1):
+                if cancel is not None and cancel.is_set():
+                    raise InterruptedError
+                if progress is not None and done % every == 0:
+                    progress(done, total)
+        # mkstemp files are 0600; give the result the mode an ordinary
+        # open() would, or keep the mode of the file being replaced
+        try:
+            import shutil
+
+            shutil.copymode(path, tmp)
+        except FileNotFoundError:
+            os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, path)
+    except InterruptedError:
+        os.remove(tmp)
+        return False
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    if progress is not None:
+        progress(total, total)
+    return True
+
+
+def browser_command(urls):
+    """
+    Command line that opens all `urls` as tabs in one Chrome invocation on
+    this platform, or None if Chrome can't be found.
+    """
+    if sys.platform == "darwin":
+        return ["open", "-a", "Google Chrome", *urls]
+
+    import shutil
+
+    names = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser")
+    if sys.platform == "win32":
+        names = ("chrome",)
+    for name in names:
+        exe = shutil.which(name)
+        if exe:
+            return [exe, *urls]
+
+    if sys.platform == "win32":
+        # Chrome's installer doesn't put it on PATH, so try where it goes
+        chrome = os.path.join("Google", "Chrome", "Application", "chrome.exe")
+        for var in ("ProgramFiles", "ProgramFiles(x86)", "LocalAppData"):
+            base = os.environ.get(var)
+            if base and os.path.isfile(os.path.join(base, chrome)):
+                return [os.path.join(base, chrome), *urls]
+    return None
+
+
+def launch_browser(urls):
+    """Open `urls` with a single browser process, else via webbrowser."""
+    cmd = browser_command(urls)
+    if cmd:
+        import subprocess
+
+        try:
+            subprocess.Popen(cmd)
+            return
+        except OSError:
+            pass
+    # fallback to default browser
+    import webbrowser
+
+    for url in urls:
+        webbrowser.open_new_tab(url)
+
+
+def open_urls(urls, batch_size, delay, progress=None, cancel=None):
+    """
+    Open `urls` in batches of `batch_size`, waiting `delay` seconds between
+    batches so the browser isn't flooded. Returns how many were opened,
+    which is fewer than len(urls) if `cancel` got set part way.
+    """
+    for start in range(0, len(urls), batch_size):
+        if start:
+            if cancel is None:
+                time.sleep(delay)
+            elif cancel.wait(delay):  # doubles as an interruptible sleep
+                return start
+        batch = urls[start : start + batch_size]
+        launch_browser(batch)
+        if progress is not None:
+            progress(start + len(batch), len(urls))
+    return len(urls)
+
+
+LINK_CACHE_PATH = os.path.expanduser("~/.onetab_linkcache.json")
+
+# codes that mean the page is there but won't talk to us, rather than gone
+LINK_ALIVE_CODES = (401, 403, 429)
+
+
+def is_dead(status):
+    """True for a LinkChecker status that means the page is gone."""
+    if status == "error":
+        return True
+    if status in LINK_ALIVE_CODES:
+        return False
+    return isinstance(status, int) and status >= 400
+
+
+class LinkChecker:
+    """
+    Checks many URLs concurrently for dead links.
+
+    Each URL gets a HEAD request, falling back to GET when the server
+    doesn't support HEAD. Connections are pooled and reused per host, at
+    most `per_host` requests hit one host at a time, and HTTP codes are
+    kept in a JSON cache at `cache_path` for `ttl` seconds. A status is the
+    final HTTP code, or "error" if the request failed outright; errors are
+    never cached, since they're as likely to mean we were offline.
+    Only one check may run at a time.
+    """
+
+    def __init__(
+        self,
+        cache_path=LINK_CACHE_PATH,
+        ttl=7 * 86400,
+        workers=32,
+        per_host=4,
+        timeout=10,
+    ):
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.workers = workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self._cache = None
+        self._cache_lock = threading.Lock()
+        self._running = threading.Lock()
+
+    @property
+    def cache(self):
+        """url -> [status, checked_at], read from disk on first use."""
+        with self._cache_lock:
+            if self._cache is None:
+                import json
+
+                try:
+                    with open(self.cache_path, "r", encoding="utf-8") as f:
+                        self._cache = json.load(f)
+                except (OSError, ValueError):
+                    self._cache = {}
+            return self._cache
+
+    def save_cache(self):
+        import json
+        import tempfile
+
+        cache = self.cache
+        with self._cache_lock:
+            snapshot = dict(cache)
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(
+                dir=os.path.dirname(self.cache_path) or ".", suffix=".tmp"
+            )
+            with open(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp, self.cache_path)
+        except BaseException:
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    def cached(self, url, now=None):
+        """The cached status for `url`, or None if missing or expired."""
+        hit = self.cache.get(url)
+        now = time.time() if now is None else now
+        if hit is not None and now - hit[1] < self.ttl:
+            return hit[0]
+        return None
+
+    def check_one(self, session, url):
+        import requests
+
+        # ValueError covers URLs too malformed for requests to parse
+        errors = (requests.RequestException, ValueError)
+        try:
+            head = session.head(url, timeout=self.timeout, allow_redirects=True)
+            head_status = head.status_code
+        except errors:
+            head_status = None
+        if head_status is not None and head_status < 400:
+            return head_status
+
+        # plenty of servers mishandle HEAD (error codes, resets, hangs), so
+        # only trust a failure from GET (streamed, so the body isn't
+        # downloaded); if GET fails outright, the HEAD code is all we have
+        try:
+            resp = session.get(
+                url, timeout=self.timeout, allow_redirects=True, stream=True
+            )
+            resp.close()
+            return resp.status_code
+        except errors:
+            return "error" if head_status is None else head_status
+
+    def check(self, urls, progress=None, cancel=None, refresh=False):
+        """
+        Return {url: status} for every http(s) URL in `urls`. Fresh cache
+        entries are reused unless `refresh` is set; the rest are fetched.
+        If `cancel` gets set, returns what has been checked so far.
+        Raises RuntimeError if another check is already running.
+        """
+        if not self._running.acquire(blocking=False):
+            raise RuntimeError("A link check is already running")
+        try:
+            return self._check(urls, progress, cancel, refresh)
+        finally:
+            self._running.release()
+
+    def _check(self, urls, progress, cancel, refresh):
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        now = time.time()
+        results = {}
+        by_host = {}
+        for url in dict.fromkeys(urls):
+            if not url or not url.startswith(("http://", "https://")):
+                continue
+            status = None if refresh else self.cached(url, now)
+            if status is not None:
+                results[url] = status
+                continue
+            try:
+                host = urlparse(url).netloc
+            except ValueError:  # e.g. "http://[bad"
+                results[url] = "error"
+                continue
+            by_host.setdefault(host, []).append((url, host))
+
+        # interleave hosts so a big host doesn't park every worker on its
+        # semaphore while other hosts sit idle
+        todo = []
+        queues = list(by_host.values())
+        for i in range(max(map(len, queues), default=0)):
+            todo.extend(q[i] for q in queues if i < len(q))
+        limits = {host: threading.Semaphore(self.per_host) for host in by_host}
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max(len(by_host), 1), pool_maxsize=self.per_host
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        def fetch(url, host):
+            if cancel is not None and cancel.is_set():
+                return url, None
+            with limits[host]:
+                return url, self.check_one(session, url)
+
+        total = len(results) + len(todo)
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            futures = [pool.submit(fetch, url, host) for url, host in todo]
+            for future in as_completed(futures):
+                url, status = future.result()
+                if status is None:
+                    continue
+                results[url] = status
+                if status != "error":
+                    cache = self.cache
+                    with self._cache_lock:
+                        cache[url] = [status, time.time()]
+                if progress is not None:
+                    progress(len(results), total)
+                if cancel is not None and cancel.is_set():
+                    break
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            session.close()
+            # the cache is only an optimisation; never lose results over it
+            try:
+                self.save_cache()
+            except OSError as e:
+                print(f"Could not save link cache {self.cache_path!r}: {e}")
+        return results
+
+
+class TabSelection:
+    """
+    Set of selected tab IDs, stored as the bits of one Python int.
+
+    Whole-set operations take a mask of tab IDs (see mask()) and are plain
+    big-int bitwise ops, so select-all, invert and count cost O(n/64)
+    machine words however many tabs are involved.
+    """
+
+    def __init__(self):
+        self.bits = 0
+
+    @staticmethod
+    def mask(ids):
+        """Bitmask with the given tab IDs set."""
+        buf = bytearray()
+        for i in ids:
+            byte = i >> 3
+            if byte >= len(buf):
+                buf.extend(bytes(byte + 1 - len(buf)))
+            buf[byte] |= 1 << (i & 7)
+        return int.from_bytes(buf, "little")
+
+    def __len__(self):
+        return self.bits.bit_count()
+
+    def __bool__(self):
+        return self.bits != 0
+
+    def __contains__(self, tab_id):
+        return (self.bits >> tab_id) & 1 == 1
+
+    def ids(self):
+        """Selected tab IDs in ascending order."""
+        # scanning the binary string is done in C, unlike shifting the int
+        digits = bin(self.bits)[:1:-1]
+        i = digits.find("1")
+        while i != -1:
+            yield i
+            i = digits.find("1", i + 1)
+
+    def clear(self):
+        self.bits = 0
+
+    def select(self, mask):
+        self.bits |= mask
+
+    def deselect(self, mask):
+        self.bits &= ~mask
+
+    def invert(self, mask):
+        self.bits ^= mask
+
+    def keep(self, mask):
+        """Deselect everything outside `mask`."""
+        self.bits &= mask
+
+    def replace(self, mask, bits):
+        """Set the selection within `mask` to exactly `bits`."""
+        self.bits = (self.bits & ~mask) | (bits & mask)
+
+
+class Task:
+    """Handle for a piece of work running on a TaskRunner."""
+
+    def __init__(self, label, mutating):
+        self.label = label
+        self.mutating = mutating
+        self.cancel_event = threading.Event()
+        self.done = 0
+        self.total = 0
+
+    def progress(self, done, total):
+        """Called from the worker; picked up by the next UI poll."""
+        self.done = done
+        self.total = total
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+
+class TaskRunner:
+    """
+    Runs long operations on a thread pool so the Tk thread never blocks.
+
+    `work(task)` runs on a worker thread and must not touch any widgets; it
+    may call task.progress() and should check task.cancelled now and then.
+    Its result (or exception) is passed to `on_done` (or `on_error`) back on
+    the Tk thread, via a queue drained with root.after. A cancelled task's
+    result goes to `on_cancel` instead, if given. Only one mutating task
+    (one that will replace tabs_data) may run at a time.
+    """
+
+    POLL_MS = 50
+
+    def __init__(self, root, on_change, max_workers=4):
+        self.root = root
+        self.on_change = on_change
+        self.max_workers = max_workers
+        self.tasks = []
+        self.results = queue.Queue()
+        self._pool = None
+        self._polling = False
+
+    def busy(self, mutating_only=False):
+        return any(t.mutating or not mutating_only for t in self.tasks)
+
+    def submit(
+        self, label, work, on_done=None, on_error=None, on_cancel=None, mutating=False
+    ):
+        """Start `work`; returns the Task, or None if refused."""
+        if mutating and self.busy(mutating_only=True):
+            return None
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="onetab"
+            )
+        task = Task(label, mutating)
+        self.tasks.append(task)
+        self._pool.submit(self._run, task, work, (on_done, on_error, on_cancel))
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_MS, self._poll)
+        self.on_change()
+        return task
+
+    def _run(self, task, work, callbacks):
+        try:
+            result, error = work(task), None
+        except BaseException as e:
+            result, error = None, e
+        self.results.put((task, result, error, callbacks))
+
+    def _poll(self):
+        try:
+            while True:
+                try:
+                    task, result, error, callbacks = self.results.get_nowait()
+                except queue.Empty:
+                    break
+                self.tasks.remove(task)
+                try:
+                    self._deliver(task, result, error, *callbacks)
+                except Exception as e:
+                    # a broken callback mustn't stop later results arriving
+                    messagebox.showerror("Error", f"{task.label} failed: {e}")
+            self.on_change()
+        finally:
+            if self.tasks:
+                self.root.after(self.POLL_MS, self._poll)
+            else:
+                self._polling = False
+
+    def _deliver(self, task, result, error, on_done, on_error, on_cancel):
+        if task.cancelled:
+            if on_cancel is not None and error is None:
+                on_cancel(result)
+            return
+        if error is not None:
+            if on_error is not None:
+                on_error(error)
+            else:
+                messagebox.showerror("Error", f"{task.label} failed: {error}")
+        elif on_done is not None:
+            on_done(result)
+
+    def cancel_all(self):
+        for task in self.tasks:
+            task.cancel()
+
+    def shutdown(self):
+        """Cancel everything and drop queued work, without waiting for it."""
+        self.cancel_all()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
 
 class OneTabManager:
+    # "Open Selected" launches the browser once per batch of this many URLs,
+    # pausing open_batch_delay seconds between batches; see --open-batch-size
+    # and --open-batch-delay
+    open_batch_size = 20
+    open_batch_delay = 1.0
+
     def __init__(self, root):
         self.root = root
         self.current_filepath = None
+        # bumped whenever a load replaces tabs_data
+        self.load_generation = 0
         self.root.title("OneTab Manager")
         self.root.geometry("1200x700")
 
         self.tabs_data = []
         self.filtered_data = []
+        # every tab gets an "id" on load, from a counter that keeps going
+        # across loads so a late task result can't hit a newer file's tabs;
+        # the selection and visible_mask are bitsets over these IDs
+        self.next_tab_id = 0
+        self.tabs_by_id = {}
+        self.selection = TabSelection()
+        self.visible_mask = 0
+        # set while the tree is being made to mirror self.selection, so the
+        # <<TreeviewSelect>> events that causes aren't read back in
+        self._syncing_selection = False
+        # the tree only mirrors the selection for the rows on screen; this
+        # is a mask of the rows it was last synced for
+        self._mirrored_mask = 0
+        self._mirror_pending = False
+        # whether the last click was a Ctrl/Cmd-click, which toggles one row
+        # rather than replacing the whole selection
+        self._toggle_click = False
+        # the running "Open Selected" task, if any
+        self.open_task = None
+        # url -> LinkChecker status, for the Status column and link filter
+        self.link_status = {}
+        self.link_checker = LinkChecker()
+        self.link_task = None
 
         self.setup_ui()
+        self.tasks = TaskRunner(self.root, self.update_task_status)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def fetch_arxiv_title(self, arxiv_id: str) -> str | None:
         """Call arXiv’s API and return the paper’s title (or None on failure)."""
+        import xml.etree.ElementTree as ET
+
+        import requests
+
         ARXIV_API = "http://export.arxiv.org/api/query?id_list={id}"
         url = ARXIV_API.format(id=arxiv_id)
         try:
@@ -75,11 +681,19 @@ class OneTabManager:
         ttk.Button(
             file_frame, text="Save Filtered Data", command=self.save_filtered
         ).pack(side=tk.LEFT, padx=5)
-        ttk.Button(file_frame, text="Export as JSON", command=self.export_json).pack(
+        ttk.Button(file_frame, text="Export…", command=self.export_file).pack(
             side=tk.LEFT, padx=5
         )
         btn = ttk.Button(file_frame, text="Save Current", command=self.save_current)
         btn.pack(side="left", padx=4, pady=4)
+        ttk.Button(file_frame, text="Check Links", command=self.check_links).pack(
+            side=tk.LEFT, padx=5
+        )
+        ttk.Button(
+            file_frame,
+            text="Recheck All Links",
+            command=lambda: self.check_links(refresh=True),
+        ).pack(side=tk.LEFT, padx=5)
 
         # Search and filter frame
         search_frame = ttk.LabelFrame(main_frame, text="Search & Filter", padding="5")
@@ -97,6 +711,18 @@ class OneTabManager:
             side=tk.LEFT, padx=5
         )
 
+        ttk.Label(search_frame, text="Links:").pack(side=tk.LEFT, padx=5)
+        self.link_filter_var = tk.StringVar(value="All")
+        link_filter = ttk.Combobox(
+            search_frame,
+            textvariable=self.link_filter_var,
+            values=("All", "Dead", "Alive", "Unchecked"),
+            state="readonly",
+            width=10,
+        )
+        link_filter.pack(side=tk.LEFT, padx=5)
+        link_filter.bind("<<ComboboxSelected>>", self.on_search_changed)
+
         # Selection operations
         ttk.Button(
             search_frame, text="Select All Visible", command=self.select_all_visible
@@ -104,9 +730,18 @@ class OneTabManager:
         ttk.Button(search_frame, text="Deselect All", command=self.deselect_all).pack(
             side=tk.LEFT, padx=5
         )
+        ttk.Button(search_frame, text="Invert", command=self.invert_selection).pack(
+            side=tk.LEFT, padx=5
+        )
+        ttk.Button(
+            search_frame, text="Select Matching…", command=self.ask_select_matching
+        ).pack(side=tk.LEFT, padx=5)
         ttk.Button(
             search_frame, text="Delete Selected", command=self.delete_selected
         ).pack(side=tk.LEFT, padx=5)
+        ttk.Button(
+            search_frame, text="Open Selected", command=self.open_selected
+        ).pack(side=tk.LEFT, padx=5)
 
         # Status label
         self.status_label = ttk.Label(search_frame, text="No data loaded")
@@ -125,9 +760,11 @@ class OneTabManager:
         # Treeview
         self.tree = ttk.Treeview(
             tree_frame,
-            columns=("title", "uRL", "domain"),
+            columns=("title", "uRL", "domain", "status"),
             show="tree headings",
-            yscrollcommand=v_scrollbar.set,
+            yscrollcommand=lambda first, last: self.on_tree_scroll(
+                v_scrollbar, first, last
+            ),
             xscrollcommand=h_scrollbar.set,
             selectmode="extended",
         )
@@ -162,12 +799,14 @@ class OneTabManager:
         self.tree.column("title", width=400)
         self.tree.column("uRL", width=500)
         self.tree.column("domain", width=200)
+        self.tree.column("status", width=70, stretch=False)
 
         # Configure headings
         self.tree.heading("#0", text="#")
         self.tree.heading("title", text="Title")
         self.tree.heading("uRL", text="URL")
         self.tree.heading("domain", text="Domain")
+        self.tree.heading("status", text="Status")
 
         # Style configuration for better visibility
         style = ttk.Style()
@@ -176,13 +815,17 @@ class OneTabManager:
         )
 
         # Bind selection change event
-        self.tree.bind("<<TreeviewSelect>>", lambda e: self.update_info())
+        self.tree.bind("<<TreeviewSelect>>", lambda e: self.on_tree_select())
+        self.tree.bind("<ButtonPress-1>", self.on_tree_press)
+        self.tree.bind("<KeyPress>", self.on_tree_press)
         self.tree.bind("<Double-1>", self.on_double_click)
 
         # Add keyboard shortcuts
         self.root.bind("<Control-a>", lambda e: self.select_all_visible())
         self.root.bind("<Control-A>", lambda e: self.select_all_visible())
         self.root.bind("<Delete>", lambda e: self.delete_selected())
+        self.root.bind("<Control-i>", lambda e: self.invert_selection())
+        self.root.bind("<Control-o>", lambda e: self.open_selected())
         self.root.bind("<Control-f>", lambda e: self.search_entry.focus())
         self.root.bind("<Control-F>", lambda e: self.search_entry.focus())
         
@@ -209,16 +852,37 @@ class OneTabManager:
         )
         self.info_label.pack(side=tk.LEFT)
 
+        # Background task status; only packed while something is running
+        self.task_label = ttk.Label(info_frame)
+        self.task_progress = ttk.Progressbar(info_frame, length=150, maximum=100)
+        self.task_cancel = ttk.Button(
+            info_frame, text="Cancel", command=lambda: self.tasks.cancel_all()
+        )
+
         # Keyboard shortcuts info
         shortcuts_label = ttk.Label(
             info_frame,
-            text="Shortcuts: Ctrl+A (Select All) | Delete (Delete Selected) | Ctrl+F (Search)",
+            text="Shortcuts: Ctrl+A (Select All) | Ctrl+I (Invert) | "
+            "Delete (Delete Selected) | Ctrl+O (Open Selected) | Ctrl+F (Search)",
             foreground="gray",
         )
         shortcuts_label.pack(side=tk.RIGHT, padx=10)
 
-        # after you create & layout everything, before root.mainloop()
-        self.root.update()  # make sure window exists
+        # raising/focusing the window isn't needed to draw it, so let the
+        # first paint happen and do it from the event loop instead of
+        # forcing a synchronous root.update() here
+        self.root.after_idle(self.bring_to_front)
+
+    def on_close(self):
+        """
+        Stop background work before the window goes, so a link check or
+        bulk open doesn't carry on in an invisible process.
+        """
+        self.tasks.shutdown()
+        self.root.destroy()
+
+    def bring_to_front(self):
+        """Lift the window above others and give it keyboard focus."""
         self.root.lift()  # lift it above all other windows
         # temporarily make it the top‐most window
         self.root.attributes("-topmost", True)
@@ -234,32 +898,73 @@ class OneTabManager:
         if not item_id:
             return
 
-        # columns = (title, url, domain), so value[1] is the URL
-        title, url, domain = self.tree.item(item_id, "values")
+        # rows are keyed by tab ID
+        tab = self.tabs_by_id[int(item_id)]
+        url = tab.get("url")
         if not url:
             messagebox.showinfo("No URL", "There’s no URL in this row.")
             return
 
-        # open in Chrome (macOS)
-        try:
-            subprocess.Popen(["open", "-a", "Google Chrome", url])
-        except Exception:
-            # fallback to default browser
-            import webbrowser
-
-            webbrowser.open_new_tab(url)
+        launch_browser([url])
 
         # remove from in-memory lists
-        # find its index in the filtered list
-        idx = int(self.tree.item(item_id, "text")) - 1
-        tab = self.filtered_data.pop(idx)
-        # also remove from the master list
-        if tab in self.tabs_data:
-            self.tabs_data.remove(tab)
-
+        self.remove_tabs([tab])
+
+    def selected_tabs(self):
+        """Selected tabs, in display order."""
+        selected = set(self.selection.ids())
+        return [tab for tab in self.filtered_data if tab["id"] in selected]
+
+    def remove_tabs(self, tabs):
+        """Drop `tabs` from both lists and redraw once."""
+        self.remove_ids({tab["id"] for tab in tabs})
+
+    def remove_ids(self, gone):
+        """Drop the tabs with these IDs from both lists and redraw once."""
+        # IDs from before a reload, or already removed, no longer apply
+        gone = {i for i in gone if i in self.tabs_by_id}
+        if not gone:
+            return
+        self.tabs_data = [t for t in self.tabs_data if t["id"] not in gone]
+        self.filtered_data = [t for t in self.filtered_data if t["id"] not in gone]
+        for i in gone:
+            del self.tabs_by_id[i]
+        self.selection.deselect(TabSelection.mask(gone))
         # refresh the display (will re-populate the tree and update counts)
         self.refresh_display()
 
+    def open_selected(self):
+        """Open every selected tab in the browser, then remove them all."""
+        if self.open_task is not None and self.open_task in self.tasks.tasks:
+            self.status_label.config(text="Still opening the last batch of tabs")
+            return
+        tabs = [tab for tab in self.selected_tabs() if tab.get("url")]
+        if not tabs:
+            return
+        urls = [tab["url"] for tab in tabs]
+
+        # they're on their way out, so a second Ctrl+O mustn't pick them up
+        self.selection.deselect(TabSelection.mask(tab["id"] for tab in tabs))
+        self.show_selection()
+
+        def work(task):
+            return open_urls(
+                urls,
+                self.open_batch_size,
+                self.open_batch_delay,
+                progress=task.progress,
+                cancel=task.cancel_event,
+            )
+
+        def done(opened):
+            # only the ones that actually made it to the browser
+            self.remove_tabs(tabs[:opened])
+            self.status_label.config(text=f"Opened {opened} tabs")
+
+        self.open_task = self.tasks.submit(
+            f"Opening {len(urls)} tabs", work, on_done=done, on_cancel=done
+        )
+
     def sort_by(self, col, reverse=False):
         """
         Sort self.tabs_data by given column (e.g. 'domain', 'title', 'url'),
@@ -268,17 +973,8 @@ class OneTabManager:
         # sort the in-memory list
         self.tabs_data.sort(key=lambda e: e.get(col) or "", reverse=reverse)
 
-        # clear existing rows
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-
-        # re-insert rows in new order
-        for entry in self.tabs_data:
-            self.tree.insert(
-                "",
-                "end",
-                values=(entry.get("title"), entry.get("url"), entry.get("domain")),
-            )
+        # re-apply the current filter, which redraws in the new order
+        self.on_search_changed()
 
         # next time we click, flip the sort order
         # store the new reverse flag on the heading
@@ -395,11 +1091,10 @@ class OneTabManager:
                 params.update(parse_qs(parsed.fragment))
 
                 # OneTab sometimes uses 'ttl' instead of 'title', and 'uri' instead of 'url'
-                raw_title = (params.get("title") or params.get("ttl") or [""])[0]
-                raw_url = (params.get("url") or params.get("uri") or [""])[0]
-
-                title = unquote(raw_title)
-                url = unquote(raw_url)
+                # (parse_qs has already percent-decoded them, so don't unquote
+                # again or escapes inside the URL itself get mangled)
+                title = (params.get("title") or params.get("ttl") or [""])[0]
+                url = (params.get("url") or params.get("uri") or [""])[0]
 
                 if title and url:
                     return {"title": title, "url": url}
@@ -512,42 +1207,66 @@ class OneTabManager:
 
     def load_file(self):
         """Load OneTab data from file"""
+        if self.tasks.busy(mutating_only=True):
+            self.status_label.config(text="Busy, try again when done")
+            return
+
         filename = filedialog.askopenfilename(
             title="Select OneTab Export File",
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
         )
 
-        # remember it for future saves
-        self.current_filepath = filename
-
         if not filename:
             return
 
-        try:
+        def work(task):
             with open(filename, "r", encoding="utf-8") as f:
                 lines = f.readlines()
-            self.tabs_data = []
-            for line in lines:
+            tabs = []
+            for i, line in enumerate(lines):
+                if i % 10000 == 0:
+                    if task.cancelled:
+                        return None
+                    task.progress(i, len(lines))
                 tab = self.parse_onetab_line(line)
                 if tab:
                     tab["domain"] = self.get_domain(tab["url"])
-                    self.tabs_data.append(tab)
+                    tabs.append(tab)
                 else:
                     # If line is not a valid tab, treat it as a header/label
-                    self.tabs_data.append(
+                    tabs.append(
                         {"title": line.strip(), "url": None, "domain": "Unknown"}
                     )
-            self.tabs_data = self.dedupe_urls(self.tabs_data)
-            self.tabs_data = self.dedupe_tabs(self.tabs_data)
+            tabs = self.dedupe_urls(tabs)
+            tabs = self.dedupe_tabs(tabs)
+            print(f"Read {len(lines)} lines, parsed {len(tabs)} tabs")
+            return tabs
+
+        def done(tabs):
+            # remember it for future saves
+            self.current_filepath = filename
+            self.load_generation += 1
+            for i, tab in enumerate(tabs, start=self.next_tab_id):
+                tab["id"] = i
+            self.next_tab_id += len(tabs)
+            self.tabs_data = tabs
+            self.tabs_by_id = {tab["id"]: tab for tab in tabs}
+            self.selection.clear()
             self.print_domain_stats(top_n=30)
             self.filtered_data = self.tabs_data.copy()
             self.refresh_display()
             self.status_label.config(text=f"Loaded {len(self.tabs_data)} tabs")
 
-        except Exception as e:
+        def failed(e):
             messagebox.showerror("Error", f"Failed to load file: {str(e)}")
 
-        print(f"Read {len(lines)} lines, parsed {len(self.tabs_data)} tabs")
+        self.tasks.submit(
+            f"Loading {os.path.basename(filename)}",
+            work,
+            on_done=done,
+            on_error=failed,
+            mutating=True,
+        )
 
     def save_current(self):
         """
@@ -584,65 +1303,51 @@ class OneTabManager:
             if not path:
                 return
 
-        # now build the OneTab lines
-        lines = []
-        for entry in self.tabs_data:
-            url = entry.get("url")
-            title = entry.get("title", "")
-            # if url:
-            #     frag = f"ttl={quote(title)}&uri={quote(url)}"
-            #     lines.append(f"{ONE_TAB_PREFIX}#{frag}")
-            # else:
-            # breakpoint()
-            lines.append(f"{url} | {title}")
-
-        # write it out
-        with open(path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
-
-        # remember this file for next time
-        self.current_filepath = path
-        print(f"Saved {len(lines)} tabs to {path!r}")
+        # what's being written, in case a load finishes before the save does
+        count = len(self.tabs_data)
+        generation = self.load_generation
+
+        def saved():
+            # remember this file for next time, unless it's been replaced
+            if self.load_generation == generation:
+                self.current_filepath = path
+            print(f"Saved {count} tabs to {path!r}")
+
+        self.start_export(path, write_pipe, "Saved", on_done=saved, notify=False)
 
     def refresh_display(self):
         """Refresh the treeview display"""
-        # Save current selection
-        selected_indices = set()
-        for item in self.tree.selection():
-            idx = int(self.tree.item(item)["text"]) - 1
-            if 0 <= idx < len(self.filtered_data):
-                tab = self.filtered_data[idx]
-                selected_indices.add(self.tabs_data.index(tab))
-
         # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
 
-        # Add filtered items
-        items_to_select = []
+        # Add filtered items, keyed by tab ID
         for i, tab in enumerate(self.filtered_data):
-            original_index = self.tabs_data.index(tab)
-            item = self.tree.insert(
+            self.tree.insert(
                 "",
                 "end",
+                iid=str(tab["id"]),
                 text=f"{i+1}",
-                values=(tab["title"], tab["url"], tab["domain"]),
+                values=(
+                    tab["title"],
+                    tab["url"],
+                    tab["domain"],
+                    self.link_status.get(tab["url"], ""),
+                ),
             )
-            if original_index in selected_indices:
-                items_to_select.append(item)
 
-        # Restore selection
-        if items_to_select:
-            self.tree.selection_set(items_to_select)
+        # Hidden tabs can't stay selected, or Delete would remove rows the
+        # user can't see
+        self.visible_mask = TabSelection.mask(tab["id"] for tab in self.filtered_data)
+        self.selection.keep(self.visible_mask)
 
-        # Update info
-        self.update_info()
+        # Restore selection
+        self.show_selection()
 
     def update_info(self):
         """Update the info label"""
         total = len(self.tabs_data)
         filtered = len(self.filtered_data)
-        selected = len(self.tree.selection())
+        selected = len(self.selection)
         self.info_label.config(
             text=f"Total: {total} tabs | Filtered: {filtered} tabs | Selected: {selected} tabs"
         )
@@ -650,8 +1355,9 @@ class OneTabManager:
     def on_search_changed(self, event=None):
         """Handle search text change"""
         search_text = self.search_var.get().lower()
+        link_filter = self.link_filter_var.get()
 
-        if not search_text:
+        if not search_text and link_filter == "All":
             self.filtered_data = self.tabs_data.copy()
         else:
             self.filtered_data = []
@@ -659,42 +1365,156 @@ class OneTabManager:
                 title = (tab.get("title") or "").lower()
                 url = (tab.get("url") or "").lower()
                 if search_text in title or search_text in url:
-                    self.filtered_data.append(tab)
+                    if self.link_filter_matches(tab.get("url"), link_filter):
+                        self.filtered_data.append(tab)
 
         self.refresh_display()
 
+    def link_filter_matches(self, url, link_filter):
+        """Whether a tab's link check result passes the Links filter."""
+        if link_filter == "All":
+            return True
+        status = self.link_status.get(url)
+        if link_filter == "Unchecked":
+            return status is None
+        if status is None:
+            return False
+        return is_dead(status) == (link_filter == "Dead")
+
+    def check_links(self, refresh=False):
+        """
+        Check every tab's URL in the background and fill in the Status column.
+        With `refresh`, ignore cached results and fetch everything again.
+        """
+        if self.link_task is not None and self.link_task in self.tasks.tasks:
+            self.status_label.config(text="Already checking links")
+            return
+        urls = [tab["url"] for tab in self.tabs_data if tab.get("url")]
+        if not urls:
+            messagebox.showwarning("No Data", "No links to check")
+            return
+
+        def work(task):
+            return self.link_checker.check(
+                urls, progress=task.progress, cancel=task.cancel_event, refresh=refresh
+            )
+
+        def done(results):
+            self.link_status.update(results)
+            dead = sum(1 for status in results.values() if is_dead(status))
+            self.status_label.config(
+                text=f"Checked {len(results)} links, {dead} dead"
+            )
+            self.on_search_changed()
+
+        self.link_task = self.tasks.submit(
+            f"Checking {len(urls)} links", work, on_done=done, on_cancel=done
+        )
+
     def clear_search(self):
         """Clear search and show all tabs"""
         self.search_var.set("")
         self.on_search_changed()
 
+    # upper bound on rows mirrored at once, in case yview() reports the
+    # whole list before the tree has been laid out
+    MAX_MIRRORED_ROWS = 500
+
+    def viewport_tabs(self):
+        """The filtered tabs whose rows are currently scrolled into view."""
+        n = len(self.filtered_data)
+        first, last = self.tree.yview()
+        start = max(0, int(first * n) - 1)
+        stop = min(n, int(last * n) + 2, start + self.MAX_MIRRORED_ROWS)
+        return self.filtered_data[start:stop]
+
+    def show_selection(self):
+        """
+        Make the tree's selection match self.selection for the rows on
+        screen. Off-screen rows are left unselected in the widget, so this
+        costs the same for 10 selected tabs as for 100k.
+        """
+        self._mirror_pending = False
+        shown = [tab["id"] for tab in self.viewport_tabs()]
+        self._mirrored_mask = TabSelection.mask(shown)
+        self._syncing_selection = True
+        self.tree.selection_set([str(i) for i in shown if i in self.selection])
+        # the <<TreeviewSelect>> this queues is handled before idle callbacks
+        self.root.after_idle(setattr, self, "_syncing_selection", False)
+        self.update_info()
+
+    def on_tree_scroll(self, scrollbar, first, last):
+        """yscrollcommand: move the scrollbar and re-mirror the new rows."""
+        scrollbar.set(first, last)
+        if not self._mirror_pending:
+            self._mirror_pending = True
+            self.root.after_idle(self.show_selection)
+
+    def on_tree_press(self, event):
+        """Note whether this click toggles, for on_tree_select."""
+        toggle = 0x4  # Control
+        if self.root.tk.call("tk", "windowingsystem") == "aqua":
+            toggle |= 0x8  # Command
+        self._toggle_click = event.type == tk.EventType.ButtonPress and bool(
+            event.state & toggle
+        )
+
+    def on_tree_select(self):
+        """Copy a selection made with the mouse/keyboard into self.selection."""
+        if self._syncing_selection:
+            return
+        picked = TabSelection.mask(int(item) for item in self.tree.selection())
+        if self._toggle_click:
+            # Ctrl/Cmd-click only changed a row on screen; keep the rest
+            self.selection.replace(self._mirrored_mask | picked, picked)
+        else:
+            # plain/Shift-click and arrow keys replace the whole selection
+            # (a Shift range may include rows off screen, which Tk reports)
+            self.selection.replace(self.visible_mask, picked)
+        self.update_info()
+
     def select_all_visible(self):
         """Select all currently visible (filtered) tabs"""
-        all_items = self.tree.get_children()
-        if all_items:
-            self.tree.selection_set(all_items)
-        self.update_info()
+        self.selection.select(self.visible_mask)
+        self.show_selection()
 
     def deselect_all(self):
         """Deselect all tabs"""
-        self.tree.selection_remove(self.tree.get_children())
-        self.update_info()
+        self.selection.clear()
+        self.show_selection()
+
+    def invert_selection(self):
+        """Select the visible tabs that aren't selected, and vice versa"""
+        self.selection.invert(self.visible_mask)
+        self.show_selection()
+
+    def select_matching(self, query):
+        """Add visible tabs whose title or URL contains `query` to the selection"""
+        query = query.lower()
+        self.selection.select(
+            TabSelection.mask(
+                tab["id"]
+                for tab in self.filtered_data
+                if query in (tab.get("title") or "").lower()
+                or query in (tab.get("url") or "").lower()
+            )
+        )
+        self.show_selection()
+
+    def ask_select_matching(self):
+        from tkinter import simpledialog
+
+        query = simpledialog.askstring(
+            "Select Matching", "Select visible tabs whose title or URL contains:"
+        )
+        if query:
+            self.select_matching(query)
 
     def delete_selected(self, event=None):
         """Remove the selected rows from both the GUI and your data lists."""
-        sel = self.tree.selection()
-        if not sel:
+        if not self.selection:
             return
-
-        # delete in reverse order so indices don’t shift under you
-        for item_id in reversed(sel):
-            idx = self.tree.index(item_id)  # <-- get the 0-based row number
-            tab = self.filtered_data.pop(idx)  # remove from filtered view
-            if tab in self.tabs_data:  # also remove from master list
-                self.tabs_data.remove(tab)
-
-        # re-draw the tree (and re-number any row-labels if you had them)
-        self.refresh_display()
+        self.remove_ids(set(self.selection.ids()))
 
     def _delete_selected(self):
         """Delete selected tabs"""
@@ -734,48 +1554,150 @@ class OneTabManager:
         )
 
         if filename:
-            try:
-                with open(filename, "w", encoding="utf-8") as f:
-                    for tab in self.tabs_data:
-                        f.write(f"{tab['url']} | {tab['title']}\n")
-
-                messagebox.showinfo(
-                    "Success",
-                    f"Saved {len(self.tabs_data)} tabs to {os.path.basename(filename)}",
-                )
+            self.start_export(filename, write_pipe, "Saved")
 
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save file: {str(e)}")
-
-    def export_json(self):
-        """Export tabs as JSON"""
+    def export_file(self):
+        """Export tabs as JSON Lines, JSON, CSV or OneTab lines"""
         if not self.tabs_data:
             messagebox.showwarning("No Data", "No data to export")
             return
 
+        formats = EXPORT_FORMATS.items()
         filename = filedialog.asksaveasfilename(
-            title="Export as JSON",
-            defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            title="Export Tabs",
+            defaultextension=".jsonl",
+            filetypes=[
+                *((f"{label} files", f"*{ext}") for ext, (label, _) in formats),
+                ("All files", "*.*"),
+            ],
         )
 
         if filename:
-            try:
-                with open(filename, "w", encoding="utf-8") as f:
-                    json.dump(self.tabs_data, f, indent=2, ensure_ascii=False)
+            ext = os.path.splitext(filename)[1].lower()
+            _, writer = EXPORT_FORMATS.get(ext, EXPORT_FORMATS[".jsonl"])
+            self.start_export(filename, writer, "Exported")
+
+    def start_export(self, filename, writer, verb, on_done=None, notify=True):
+        """Run export_tabs() as a background task."""
+        # shallow copy so edits made while exporting don't race the writer
+        tabs = list(self.tabs_data)
+        name = os.path.basename(filename)
+
+        def work(task):
+            return export_tabs(
+                tabs,
+                filename,
+                writer,
+                progress=task.progress,
+                cancel=task.cancel_event,
+            )
+
+        def done(completed):
+            if not completed:
+                return
+            self.status_label.config(text=f"{verb} {len(tabs)} tabs")
+            if on_done is not None:
+                on_done()
+            if notify:
+                messagebox.showinfo("Success", f"{verb} {len(tabs)} tabs to {name}")
+
+        def failed(e):
+            self.status_label.config(text=f"Failed to write {name}")
+            messagebox.showerror("Error", f"Failed to write file: {str(e)}")
+
+        self.tasks.submit(f"Writing {name}", work, on_done=done, on_error=failed)
+
+    def update_task_status(self):
+        """Show the running task, its progress and a cancel button, or hide them."""
+        widgets = (self.task_label, self.task_progress, self.task_cancel)
+        if not self.tasks.tasks:
+            for w in widgets:
+                w.pack_forget()
+            return
 
-                messagebox.showinfo(
-                    "Success",
-                    f"Exported {len(self.tabs_data)} tabs to {os.path.basename(filename)}",
-                )
+        task = self.tasks.tasks[0]
+        more = len(self.tasks.tasks) - 1
+        text = task.label + (f" (+{more} more)" if more else "")
+        self.task_label.config(text=text)
+        self.task_progress["value"] = task.done * 100 // max(task.total, 1)
+        if not self.task_label.winfo_ismapped():
+            for w in widgets:
+                w.pack(side=tk.LEFT, padx=5)
 
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export file: {str(e)}")
+
+# default --startup-bench budget for time-to-first-paint, in milliseconds
+STARTUP_BUDGET_MS = 1500
+
+
+def startup_bench(root, budget_ms):
+    """
+    Report time-to-first-paint and exit, with status 1 if it took longer
+    than `budget_ms` or any of _DEFERRED_MODULES got imported on the way.
+    Run under ``python -X importtime`` to also get the per-module import
+    cost on stderr.
+    """
+
+    def on_map(event):
+        if event.widget is not root:
+            return
+        root.unbind("<Map>")
+        # the first paint happens in the idle pass right after mapping
+        root.after_idle(report)
+
+    def report():
+        elapsed = (time.perf_counter() - _STARTUP_T0) * 1000
+        loaded = [m for m in _DEFERRED_MODULES if m in sys.modules]
+        over = elapsed > budget_ms
+        print(f"Time to first paint: {elapsed:.1f} ms (budget {budget_ms:g} ms)")
+        if over:
+            print("Startup is over budget")
+        if loaded:
+            print(f"Modules loaded eagerly at startup: {', '.join(loaded)}")
+        root.destroy()
+        sys.exit(1 if loaded or over else 0)
+
+    root.bind("<Map>", on_map)
+
+
+def parse_args(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="OneTab Manager")
+    parser.add_argument(
+        "--startup-bench",
+        nargs="?",
+        type=float,
+        const=STARTUP_BUDGET_MS,
+        metavar="MS",
+        help="print time-to-first-paint and exit; fails if it takes longer "
+        f"than MS milliseconds (default {STARTUP_BUDGET_MS})",
+    )
+    parser.add_argument(
+        "--open-batch-size",
+        type=int,
+        default=OneTabManager.open_batch_size,
+        metavar="N",
+        help="URLs handed to the browser per launch by Open Selected "
+        "(default %(default)s)",
+    )
+    parser.add_argument(
+        "--open-batch-delay",
+        type=float,
+        default=OneTabManager.open_batch_delay,
+        metavar="SECONDS",
+        help="pause between Open Selected batches (default %(default)s)",
+    )
+    return parser.parse_args(argv)
 
 
 def main():
+    args = parse_args()
     root = tk.Tk()
     app = OneTabManager(root)
+    app.open_batch_size = max(1, args.open_batch_size)
+    app.open_batch_delay = max(0.0, args.open_batch_delay)
+    if args.startup_bench is not None:
+        startup_bench(root, args.startup_bench)
     root.mainloop()
 
 